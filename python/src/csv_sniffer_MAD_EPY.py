@@ -16,8 +16,10 @@ Enhanced with a twist: Incorporates Bayesian prior in dialect scoring for improv
 """
 
 from typing import List
+from typing import Optional
 from typing import Union
 from csv_dialect import Dialect
+from table_def import table_constructor
 from table_score_MAD_EPY import t_score
 from potential_dialects import p_dialects
 
@@ -37,6 +39,9 @@ class sniffer:
         List of escape characters to be considered in dialect detection.
     encoding : str
         Codec to be used to read the CSV file.
+    type_sample_cap : int
+        Count of records used to infer field types. None, the default, uses every
+        loaded record; lower values trade accuracy for speed.
     """
     def __init__(
         self,
@@ -45,12 +50,14 @@ class sniffer:
         delimiter_list: List[str] = [',', ';', '\t', ':', ' '],
         quotechar_list: List[str] = ['"', "'", '~'],
         encoding: str = 'utf_8',
+        type_sample_cap: Optional[int] = None,
     ):
         self.file_path = file_path
         self.threshold = threshold
         self.delimiter_list = delimiter_list
         self.quotechar_list = quotechar_list
         self.encoding = encoding
+        self.type_sample_cap = type_sample_cap
 
     def validate(self) -> None:
         if self.file_path is None or len(self.file_path) == 0:
@@ -58,6 +65,11 @@ class sniffer:
                 "The path to the target CSV file should be provided, got: %r"
                 % self.file_path
             )
+        if self.type_sample_cap is not None and self.type_sample_cap < 1:
+            raise ValueError(
+                "The type sample cap should be a positive count of records, got: %r"
+                % self.type_sample_cap
+            )
 
     def sniff(self) -> Union[Dialect, None]:
         self.validate()
@@ -65,15 +77,40 @@ class sniffer:
         dialects = p_dialects.get_dialects(p_dialects(self.delimiter_list, self.quotechar_list))
         n = len(dialects)
         scores = [0] * n
+        best_score = 0
+        # The csv reader ignores the records delimiter, so dialects sharing the fields
+        # delimiter and the quote character load the same sample and type scores
+        type_scores = {}
+        # Detected types of the sample fields, reused by every dialect of this file only
+        type_cache = {}
+        # Read the head of the file once, every dialect parses the same lines
+        table_obj = table_constructor(file_path=self.file_path, 
+                                      threshold=self.threshold, 
+                                      encoding=self.encoding)
+        try:
+            table_obj.read_lines()
+        except (OSError, UnicodeDecodeError):
+            # Every dialect falls back to reading the file by itself
+            pass
         for j, d in enumerate(dialects):
+            key = (d.delimiter, d.quotechar)
             t_scoring = t_score(csv_path=self.file_path, 
                                 dialect=d, 
                                 threshold=self.threshold, 
-                                encoding=self.encoding)
+                                encoding=self.encoding,
+                                type_scores=type_scores.get(key),
+                                type_sample_cap=self.type_sample_cap,
+                                table_obj=table_obj,
+                                type_cache=type_cache)
             try:
-                scores[j] = t_scoring.compute()
+                # Dialects unable to beat the best score are bailed out early
+                scores[j] = t_scoring.compute(best=best_score)
+                if t_scoring.type_scores is not None:
+                    type_scores[key] = t_scoring.type_scores
             except:
                 scores[j] = 0
+            if scores[j] > best_score:
+                best_score = scores[j]
         return get_best_dialect(scores, dialects)
 
 def get_best_dialect(
@@ -16,8 +16,12 @@ import os
 import sys
 import codecs
 
+from itertools import islice
+
 from csv_dialect import Dialect
+from typing import Iterable
 from typing import List
+from typing import Optional
 
 class table_constructor:
     """
@@ -45,6 +49,9 @@ class table_constructor:
         self.file_path = file_path
         self.threshold = threshold
         self.encoding = encoding
+        self.lines = None
+        self.lines_truncated = False
+        self.lines_read = 0
     
     def validate(self) -> None:
         if self.file_path is None or len(self.file_path) == 0:
@@ -53,12 +60,86 @@ class table_constructor:
                 % self.file_path
             )
     
+    def read_lines(
+        self, max_lines: Optional[int] = None
+    ) -> List[str]:
+
+        """
+        Read and keep the non-blank lines at the head of the CSV file, so the sample
+        can be parsed with several dialects without reading the file again. Once read,
+        fromCSV parses these lines and only goes back to the file when they hold fewer
+        records than the threshold.
+
+        Parameters
+        ----------
+        max_lines: int
+            count of lines to keep, default is four times the threshold to leave room
+            for comments and multi-line fields. Every line is kept for non-positive
+            thresholds
+
+        Returns
+        -------
+            the list of lines read from the CSV file
+
+        """
+
+        self.validate()
+        if max_lines is None and self.threshold > 0:
+            max_lines = 4 * self.threshold
+        with open(self.file_path) as csvfile:
+            if max_lines is None:
+                lines = list(filter(str.strip, csvfile))
+            else:
+                lines = list(islice(filter(str.strip, csvfile), max_lines + 1))
+        self.lines_truncated = max_lines is not None and len(lines) > max_lines
+        self.lines = lines[:max_lines]
+        return self.lines
+
+    def from_lines(
+        self, lines: Iterable[str], _dialect: Dialect
+    ) -> List[List[str]]:
+
+        """
+        Create a table by parsing CSV lines with the given dialect.
+
+        Parameters
+        ----------
+        lines: Iterable[str]
+            the lines to be parsed, either a list or an open file
+
+        dialect: Dialect
+            the dialect to be used to parse the lines
+
+        Returns
+        -------
+            a list of string list generated by parsing the lines. The count of lines
+            consumed by the parser is kept in the lines_read attribute.
+
+        """
+
+        # Blank lines are dropped by the C-level filter before parsing
+        reader_obj = csv.reader(filter(str.strip, lines), 
+                                delimiter=_dialect.delimiter,
+                                quotechar=_dialect.quotechar, 
+                                lineterminator=_dialect.records_delimiter
+                                )
+        #Take records up to threshold (all of them for non-positive values), skipping those
+        #with an empty or commented first field
+        ts = self.threshold
+        dataSample = list(islice(
+            (record for record in reader_obj if record[0][:1] not in ('', '#')),
+            None if ts < 1 else ts
+        ))
+        self.lines_read = reader_obj.line_num
+        return dataSample
+
     def fromCSV(
         self, _dialect: Dialect
     ) -> List[List[str]]:
         
         """
-        Create a table by parsing a CSV file with the given dialect.
+        Create a table by parsing a CSV file with the given dialect. Lines kept by
+        read_lines are parsed instead of the file whenever they are enough.
 
         Parameters
         ----------
@@ -72,38 +153,49 @@ class table_constructor:
         """
 
         self.validate()
-        dataSample = []
-        record = []
-        ts = self.threshold
         #Get data
         try:
+            if self.lines is not None:
+                try:
+                    dataSample = self.from_lines(self.lines, _dialect)
+                    #Kept lines are enough when they hold the whole file, or when the last
+                    #sampled record ended before the last kept line: a record reaching it
+                    #may be cut in half
+                    if not self.lines_truncated or self.lines_read < len(self.lines):
+                        return dataSample
+                except csv.Error:
+                    pass
             #with open(self.file_path, encoding=self.encoding) as csvfile:
             with open(self.file_path) as csvfile:
-                """
-                reader_obj = csv.reader(CommentStripper(csvfile), 
-                                        delimiter=_dialect.delimiter,
-                                        quotechar=_dialect.quotechar, 
-                                        lineterminator=_dialect.records_delimiter
-                                        )
-                """
-                reader_obj = csv.reader(EmptyLineStripper(csvfile), 
-                                        delimiter=_dialect.delimiter,
-                                        quotechar=_dialect.quotechar, 
-                                        lineterminator=_dialect.records_delimiter
-                                        )
-                #Loop records up to threshold
-                i = 0
-                for record in reader_obj:
-                    if record[0] != '':
-                        if record[0][0] != '#': #Skip comment
-                            i +=1
-                            dataSample.append(record)
-                    if i == ts:
-                        break
-            return dataSample
+                return self.from_lines(csvfile, _dialect)
         except Exception as e:
             pass
 
+def to_columns(
+    table: List[List[str]]
+) -> List[List[str]]:
+    """
+    Transpose a table of records into a list of columns. Records shorter than
+    the widest one just don't contribute to the missing columns.
+
+    Parameters
+    ----------
+    table: List[List[str]]
+        the table as a List of String List
+
+    Returns
+    -------
+        a list of string list holding the fields of each column
+
+    """
+    columns = []
+    for record in table:
+        for col_idx, field in enumerate(record):
+            if col_idx == len(columns):
+                columns.append([])
+            columns[col_idx].append(field)
+    return columns
+
 """
 
 Credits 
@@ -112,12 +204,6 @@ Credits
    
 """
 
-def EmptyLineStripper (iterator):
-    for line in iterator:
-        if not line.strip ():
-            continue
-        yield line
-
 def CommentStripper (iterator):
     for line in iterator:
         if line [:1] == '#':
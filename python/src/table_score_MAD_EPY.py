@@ -15,7 +15,10 @@ and a refined overall score (omega') from table_uniformity.py.
 
 """
 
+from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Tuple
 from csv_dialect import Dialect
 from table_def import table_constructor 
 from table_uniformity_MAD_EPY import t_uniformity
@@ -34,6 +37,18 @@ class t_score:
         Count of records to load from CSV file, default value is 10.
     encoding : str
         Codec to be used to read the CSV file.
+    type_scores : Tuple[List[float], float], optional
+        Column type scores and lambda_sum of a previous scoring of the same sample
+        and dialect. Updated by compute when the type inference runs.
+    type_sample_cap : int, optional
+        Count of records used to infer field types. None, the default, uses every
+        loaded record; lower values trade accuracy for speed.
+    table_obj : table_constructor, optional
+        Constructor for the same file and threshold, shared between dialects. When
+        its lines were read with read_lines, the sample is parsed from them.
+    type_cache : dict, optional
+        Detected types keyed by (cleaned field, is_quoted), shared between the
+        dialects tried on the same file.
     """
     def __init__(
         self,
@@ -41,11 +56,19 @@ class t_score:
         dialect: Dialect,
         threshold: int = 10,
         encoding: str = 'utf_8',
+        type_scores: Optional[Tuple[List[float], float]] = None,
+        type_sample_cap: Optional[int] = None,
+        table_obj: Optional[table_constructor] = None,
+        type_cache: Optional[Dict[Tuple[str, bool], Optional[str]]] = None,
     ) -> None:
         self.csv_path = csv_path
         self.dialect = dialect
         self.threshold = threshold
         self.encoding = encoding
+        self.type_scores = type_scores
+        self.type_sample_cap = type_sample_cap
+        self.table_obj = table_obj
+        self.type_cache = type_cache
 
     def validate(self) -> None:
         if self.csv_path is None or len(self.csv_path) == 0:
@@ -58,12 +81,33 @@ class t_score:
                 "The dialect should be provided, got: %r"
                 % self.dialect
             )
+        if self.type_sample_cap is not None and self.type_sample_cap < 1:
+            raise ValueError(
+                "The type sample cap should be a positive count of records, got: %r"
+                % self.type_sample_cap
+            )
 
-    def compute(self) -> float:
+    def compute(self, best: Optional[float] = None) -> float:
+        """
+        Compute the table score. When best is given, tables that cannot beat it
+        are scored as -inf without running the type inference.
+        """
         self.validate()
         # Initialize table object
-        table_obj = table_constructor(file_path=self.csv_path, threshold=self.threshold, encoding=self.encoding)
+        table_obj = self.table_obj
+        if table_obj is None:
+            table_obj = table_constructor(file_path=self.csv_path, threshold=self.threshold, encoding=self.encoding)
         sample = table_obj.fromCSV(_dialect=self.dialect)
         # Compute table uniformity with twist-enhanced metrics
-        uniformity = t_uniformity(table=sample, dialect=self.dialect)
-        return uniformity.overall_score(delta=self.threshold)
\ No newline at end of file
+        if self.type_scores is not None:
+            column_scores, lambda_sum = self.type_scores
+            uniformity = t_uniformity(table=sample, dialect=self.dialect, lambda_sum=lambda_sum,
+                                      column_scores=column_scores,
+                                      type_sample_cap=self.type_sample_cap, type_cache=self.type_cache)
+        else:
+            uniformity = t_uniformity(table=sample, dialect=self.dialect,
+                                      type_sample_cap=self.type_sample_cap, type_cache=self.type_cache)
+        score = uniformity.overall_score(delta=self.threshold, best=best)
+        if uniformity.column_scores is not None:
+            self.type_scores = (uniformity.column_scores, uniformity.lambda_sum)
+        return score
\ No newline at end of file
@@ -18,11 +18,19 @@ Reimplemented per user feedback: Total field scores summed and divided by num_co
 """
 
 import math
-import statistics  # For median
-from typing import List
+import numpy as np
 from collections import Counter
+from typing import Dict, List, Optional, Tuple
 from type_detection import type_detector, trip_quotes
 from csv_dialect import Dialect
+from table_def import to_columns
+
+# 1 / ln(2), turns natural log entropies into bits
+LOG2E = 1.4426950408889634
+
+_MISSING = object()
+# Default detector, shared so its compiled patterns are bound only once
+_DETECTOR = type_detector()
 
 class t_uniformity:
     """
@@ -34,16 +42,40 @@ class t_uniformity:
         Target table, typically parsed using a Dialect from csv_dialect.py.
     dialect : Dialect
         Dialect used to parse the table, for accurate type inference.
+    lambda_sum : float
+        Total field type scores divided by the number of columns.
+    columns : list[list[str]], optional
+        Column-wise view of the table. Built from the table when not provided.
+    column_scores : list[float], optional
+        Per column type scores of the same table and dialect, as returned by
+        compute_type_scores. When provided along with lambda_sum, the type inference
+        is not run again.
+    type_sample_cap : int, optional
+        Count of leading records used to infer field types, lambda_sum is scaled up
+        to the whole table. None, the default, uses every record.
+    type_cache : dict, optional
+        Detected types keyed by (cleaned field, is_quoted), filled by compute_type_scores.
+        Share it between the candidate dialects of one file to reuse the detections made
+        on the same sample. A private cache is used when not provided.
     """
     def __init__(
         self,
         table: list,  # list[list[str]]
         dialect: Dialect, 
-        lambda_sum: float = 0
+        lambda_sum: float = 0.0,
+        columns: Optional[list] = None,  # list[list[str]]
+        column_scores: Optional[List[float]] = None,
+        type_sample_cap: Optional[int] = None,
+        type_cache: Optional[Dict[Tuple[str, bool], Optional[str]]] = None
     ) -> None:
         self.table = table
         self.dialect = dialect
         self.lambda_sum = lambda_sum
+        self.columns = columns
+        self.column_scores = column_scores
+        self.type_sample_cap = type_sample_cap
+        self.type_cache = type_cache if type_cache is not None else {}
+        self._type_sample = None
 
     def validate(self) -> None:
         if self.table is None:
@@ -56,109 +88,141 @@ class t_uniformity:
                 "The dialect should be provided, got: %r"
                 % self.dialect
             )
+        if self.type_sample_cap is not None and self.type_sample_cap < 1:
+            raise ValueError(
+                "The type sample cap should be a positive count of records, got: %r"
+                % self.type_sample_cap
+            )
 
-    def avg_fields(self) -> float:
-        nk = 0
-        for record in self.table:
-            nk += len(record)
-        return nk / len(self.table) if self.table else 0.0
+    def type_rows(self) -> list:
+        """Records used for type inference, the leading ones when the sample is capped."""
+        cap = self.type_sample_cap
+        if cap is not None and len(self.table) > cap:
+            return self.table[:cap]
+        return self.table
+
+    def type_sample(self) -> Tuple[list, int]:
+        """Column-wise view and count of the records used for type inference, built on first use."""
+        if self._type_sample is None:
+            rows = self.type_rows()
+            if rows is self.table:
+                if self.columns is None:
+                    self.columns = to_columns(self.table)
+                self._type_sample = (self.columns, len(self.table))
+            else:
+                self._type_sample = (to_columns(rows), len(rows))
+        return self._type_sample
 
     def compute_type_scores(self) -> List[float]:
         """Compute type scores per column and per rows using type_detector; average per column for tau_2."""
         if not self.table:
             return []
-        num_cols = max(len(row) for row in self.table) if self.table else 0
-        num_rows = len(self.table)
-        column_scores = [0.0] * num_cols
+        if self.column_scores is not None:
+            return self.column_scores
+        columns, num_rows = self.type_sample()
+        num_cols = len(columns)
+        column_scores = []
         total_field_scores = 0.0
-        detector = type_detector()
-        for row in self.table:
-            for col_idx, field in enumerate(row):
-                if col_idx < num_cols:
-                    cleaned_field = trip_quotes(field, self.dialect)
-                    is_quoted = field.startswith(self.dialect.quotechar) and field.endswith(self.dialect.quotechar)
-                    field_type = detector.detect_type(cleaned_field, is_quoted)
-                    score = 100.0 if field_type is not None else 0.1
-                    total_field_scores += score
-                    column_scores[col_idx] += score
+        # Bind loop invariants to locals to skip attribute lookups per field
+        dialect = self.dialect
+        qc = dialect.quotechar
+        detect_column = _DETECTOR.detect_column
+        trip = trip_quotes
+        cache = self.type_cache
+        for column in columns:
+            keys = []
+            for field in column:
+                is_quoted = len(field) >= 2 and field[0] == qc and field[-1] == qc
+                if is_quoted:
+                    cleaned_field = field[1:-1]
+                elif len(field) >= 2 and not field[0].isspace() and not field[-1].isspace():
+                    cleaned_field = field
+                else:
+                    # Empty, one character or space padded fields
+                    cleaned_field = trip(field, dialect)
+                keys.append((cleaned_field, is_quoted))
+            key_counts = Counter(keys)
+            col_types = {key: cache.get(key, _MISSING) for key in key_counts}
+            misses = [key for key, field_type in col_types.items() if field_type is _MISSING]
+            if misses:
+                # Unseen fields go through the column-wise detection in one go
+                detected = detect_column([key[0] for key in misses], [key[1] for key in misses])
+                for key, field_type in zip(misses, detected):
+                    col_types[key] = field_type
+                    cache[key] = field_type
+            # One addition per distinct field, typed fields score 100 and the others 0.1
+            col_score = 0.0
+            for key, count in key_counts.items():
+                col_score += count * (100.0 if col_types[key] is not None else 0.1)
+            column_scores.append(col_score)
+            total_field_scores += col_score
         # Average per rows for tau_2
-        column_averages = [score / num_rows if num_rows > 0 else 0.0 for score in column_scores]
+        column_averages = [score / num_rows for score in column_scores]
+        # Scale the sampled scores up to the whole table
+        total_field_scores *= len(self.table) / num_rows
         self.lambda_sum = total_field_scores / num_cols if num_cols > 0 else 0.0
+        self.column_scores = column_averages
         return column_averages
 
     def compute_tau2(self, column_scores: List[float]) -> float:
         """Column type coherence (tau_2)."""
         if not column_scores:
             return 0.0
-        mean_score = sum(column_scores) / len(column_scores)
-        variances = [abs(score - mean_score) for score in column_scores]
-        max_var = max(variances) if max(variances) > 0 else 1.0
-        tau2 = sum(1 - (v / max_var) for v in variances) / len(variances)
+        scores = np.asarray(column_scores, dtype=np.float64)
+        variances = np.abs(scores - scores.mean())
+        max_var = variances.max() or 1.0
+        tau2 = float((1 - variances / max_var).mean())
         return tau2
 
-    def compute_tau3(self) -> float:
-        """Structural entropy (tau_3)."""
-        row_structures = []
-        for row in self.table:
-            structure = tuple(len(cell) for cell in row)  # Simple structure hash
-            row_structures.append(structure)
-        n = len(row_structures)
+    def compute_tau3(self, row_structures: Optional[List[int]] = None) -> float:
+        """Structural entropy (tau_3). Row structure hashes are built from the table when not provided."""
+        n = len(self.table)
         if n == 0:
             return 0.0
-        freq = Counter(row_structures)
-        entropy = 0.0
-        for count in freq.values():
-            p = count / n
-            if p > 0:
-                entropy -= p * math.log2(p)
+        if row_structures is None:
+            row_structures = [hash(tuple(len(cell) for cell in row)) for row in self.table]  # Simple structure hash
+        row_structures = np.asarray(row_structures, dtype=np.int64)
+        _, counts = np.unique(row_structures, return_counts=True)
+        p = counts / n
+        entropy = float(-(p * np.log(p)).sum()) * LOG2E
         return entropy
 
-    def compute(self) -> List[float]:
-        self.validate()
+    def compute_structure(self) -> List[float]:
+        """Structural metrics [tau_0, tau_1, tau_3], computed without type inference."""
         n = len(self.table)  # Number of records
         if n == 0:
-            return [0.0, 0.0, 0.0, 0.0, 0.0]  # tau0, tau1, tau2, tau3, lambda_sum
+            return [0.0, 0.0, 0.0]
 
-        # Field lengths
-        field_lengths = [len(record) for record in self.table]
+        # Single sweep over the records: field counts and row structure hashes for tau_3
+        field_lengths = []
+        row_structures = []
+        for record in self.table:
+            field_lengths.append(len(record))
+            row_structures.append(hash(tuple(map(len, record))))  # Simple structure hash
+        field_lengths = np.asarray(field_lengths, dtype=np.int32)
 
         # Improved tau_0 with MAD
         if n > 1:
-            med = statistics.median(field_lengths)
-            devs = [abs(k - med) for k in field_lengths]
-            mad = statistics.median(devs) * 1.4826
+            med = np.median(field_lengths)
+            mad = float(np.median(np.abs(field_lengths - med))) * 1.4826
             tau_0 = 1 / (1 + 2 * mad) if (1 + 2 * mad) != 0 else 1.0
         else:
             tau_0 = 1.0  # Single row is consistent
 
         # Original parts for tau_1
-        phi = self.avg_fields()
-        mu, c, sm, alpha, beta = 0, 0, 0, 0, 0
-        k_max = field_lengths[0] if field_lengths else 0
-        k_min = field_lengths[0] if field_lengths else 0
-        for i in range(n):
-            k_i = field_lengths[i]
-            mu += math.pow(k_i - phi, 2)
-            if i == 0:
-                c += 1
-                if n == 1:
-                    sm = c
-            else:
-                if k_i > k_max:
-                    k_max = k_i
-                if k_i < k_min:
-                    k_min = k_i
-                k_prev = field_lengths[i - 1]
-                if k_prev != k_i:
-                    alpha += 1
-                    if c > sm:
-                        sm = c
-                    c = 0
-                else:
-                    c += 1
-                    if i == n - 1:
-                        if c > sm:
-                            sm = c
+        phi = float(field_lengths.mean())
+        mu = float(((field_lengths - phi) ** 2).sum())
+        k_max = int(field_lengths.max())
+        k_min = int(field_lengths.min())
+        # Run-length pass: transitions and longest run of equal field counts.
+        # The counter restarts at zero after each transition, so every run
+        # but the first one counts one record less.
+        changes = np.flatnonzero(field_lengths[1:] != field_lengths[:-1]) + 1
+        alpha = len(changes)
+        runs = np.diff(np.concatenate(([0], changes, [n])))
+        runs[1:] -= 1
+        sm = int(runs.max())
+        beta = 0
         r = k_max - k_min
         if alpha > 0 and sm > 0:
             beta = sm / n
@@ -167,33 +231,65 @@ class t_uniformity:
             base_tau_1 = 0.0
 
         # Improved tau_1 with entropy
-        freq = Counter(field_lengths)
-        entropy_h = 0.0
-        for count in freq.values():
-            p = count / n
-            if p > 0:
-                entropy_h -= p * math.log2(p)
+        counts = np.bincount(field_lengths)
+        p = counts[counts > 0] / n
+        entropy_h = float(-(p * np.log(p)).sum()) * LOG2E
         tau_1 = base_tau_1 * (1 + entropy_h)
 
+        # tau_3
+        tau_3 = self.compute_tau3(row_structures)
+
+        return [tau_0, tau_1, tau_3]
+
+    def compute(self) -> List[float]:
+        self.validate()
+        if len(self.table) == 0:
+            return [0.0, 0.0, 0.0, 0.0, 0.0]  # tau0, tau1, tau2, tau3, lambda_sum
+
+        tau_0, tau_1, tau_3 = self.compute_structure()
+
         # Type scores for tau_2
         column_scores = self.compute_type_scores()
 
         # tau_2
         tau_2 = self.compute_tau2(column_scores)
 
-        # tau_3
-        tau_3 = self.compute_tau3()
-
         # lambda_sum as total field scores / num_cols
         lambda_sum = self.lambda_sum
 
         return [tau_0, tau_1, tau_2, tau_3, lambda_sum]
 
-    def overall_score(self, delta: float = 1.0) -> float:
-        """Refined overall score omega'."""
-        metrics = self.compute()
-        tau_0, tau_1, tau_2, tau_3, lambda_sum = metrics
+    def score_upper_bound(self, tau_0: float, tau_1: float, tau_3: float, delta: float = 1.0) -> float:
+        """Upper bound of omega' given the structural metrics: tau_2 = 1 and every field typed. Only valid for delta > 0."""
         n = len(self.table)
+        if n == 0 or tau_1 + n == 0:
+            return 0.0
+        # Worked out on the records, pruned dialects never build the column view
+        rows = self.type_rows()
+        num_cols = max(map(len, rows))
+        if num_cols == 0:
+            return 0.0
+        max_lambda_sum = 100.0 * sum(map(len, rows)) / num_cols * n / len(rows)
+        return ((tau_0 / delta) + (1 / (tau_1 + n)) + (1 / delta) + (1 / (tau_3 + n))) * max_lambda_sum
+
+    def overall_score(self, delta: float = 1.0, best: Optional[float] = None) -> float:
+        """
+        Refined overall score omega'. When the best score found so far is given, the type
+        inference is skipped and -inf returned as soon as the structural metrics show this
+        table cannot beat it.
+        """
+        self.validate()
+        n = len(self.table)
+        if n == 0:
+            return 0.0
+        tau_0, tau_1, tau_3 = self.compute_structure()
+        # The bound assumes tau_0 / delta and tau_2 / delta grow with tau_0 and tau_2, so
+        # only positive deltas are pruned. Small slack keeps rounding from discarding a tie
+        if (best is not None and delta > 0
+                and self.score_upper_bound(tau_0, tau_1, tau_3, delta) * (1 + 1e-9) < best):
+            return float('-inf')
+        tau_2 = self.compute_tau2(self.compute_type_scores())
+        lambda_sum = self.lambda_sum
         if tau_1 + n == 0 or tau_3 + 1 == 0:
             return 0.0
         score = ((tau_0 / delta) + (1 / (tau_1 + n)) + (tau_2 / delta) + (1 / ((tau_3 + n)))) * lambda_sum
@@ -19,8 +19,12 @@ import json
 import csv
 import math
 
+from itertools import repeat
+
 from typing import Any
 from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Pattern
@@ -30,6 +34,8 @@ from csv_dialect import Dialect
 
 DEFAULT_EPS_TYPE: float = 1e-10
 
+NAN_STRINGS: FrozenSet[str] = frozenset(("n/a", "na", "nan"))
+
 
 class type_detector:
     def __init__(
@@ -37,6 +43,8 @@ class type_detector:
         patterns: Optional[Dict[str, Pattern[str]]] = None,
     ) -> None:
         self.patterns = patterns or DEFAULT_TYPE_REGEXES.copy()
+        # Bound fullmatch methods of the precompiled patterns, looked up once
+        self._matchers = {name: pat.fullmatch for name, pat in self.patterns.items()}
         self._register_type_tests()
 
     def _register_type_tests(self) -> None:
@@ -70,11 +78,46 @@ class type_detector:
                 return name
         return None
 
+    def detect_column(
+        self,
+        cells: Iterable[str],
+        quoted: Optional[Iterable[bool]] = None
+    ) -> List[Optional[str]]:
+        """
+        Detects the data type of every cell in a column. The column keeps the type
+        found for the previous cell and tries it first, the whole sequence of type
+        tests is only walked when a cell disagrees with it. Returned names are types
+        matched by the cell, not necessarily the first one reported by detect_type.
+
+        Parameters
+        ----------
+        cells: Iterable[str]
+            the column fields, already stripped from quotes
+            
+        quoted: Iterable[bool]
+            whether each field was quoted, all False when not provided
+
+        Returns
+        -------
+        types: List[Optional[str]]
+
+        """
+        tests = dict(self._type_tests)
+        if quoted is None:
+            quoted = repeat(False)
+        types = []
+        current = None
+        for cell, is_quoted in zip(cells, quoted):
+            if current is None or not tests[current](cell, is_quoted=is_quoted):
+                current = self.detect_type(cell, is_quoted)
+            types.append(current)
+        return types
+
     def _run_regex(self, cell: str, patname: str) -> bool:
-        pat = self.patterns.get(patname, None)
-        assert pat is not None
-        match = pat.fullmatch(cell)
-        return match is not None
+        fullmatch = self._matchers.get(patname, None)
+        assert fullmatch is not None
+        return fullmatch(cell) is not None
+
     def is_number(self, cell: str, is_quoted: bool = False) -> bool:
         if cell == "":
             return False
@@ -127,9 +170,9 @@ class type_detector:
         return cell.endswith("%") and self.is_number(cell.rstrip("%"))
 
     def is_currency(self, cell: str, is_quoted: bool = False) -> bool:
-        pat = self.patterns.get("currency", None)
-        assert pat is not None
-        m = pat.fullmatch(cell)
+        fullmatch = self._matchers.get("currency", None)
+        assert fullmatch is not None
+        m = fullmatch(cell)
         if m is None:
             return False
         grp = m.group(1)
@@ -190,7 +233,7 @@ class type_detector:
         return False
 
     def is_nan(self, cell: str, is_quoted: bool = False) -> bool:
-        if cell.lower() in ["n/a", "na", "nan"]:
+        if cell.lower() in NAN_STRINGS:
             return True
         return False
 